@@ -12,13 +12,16 @@ shape stays owned by free_feed_generator.py and paid_feed_generator.py.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import json
 import os
 import re
 import tempfile
 
+import aiohttp
 import feedparser
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 from urllib.request import Request, urlopen
@@ -44,9 +47,19 @@ SOURCE_MODE_KEYS = {
 }
 
 
+_NSFW_SEARCH = NSFW_PAREN_RE.search
+
+
 def has_nsfw_marker(*texts: str) -> bool:
+    # Each text is searched separately: joining them would let a "(" in one
+    # field pair with a marker and ")" in the next. Most titles carry no
+    # parenthesis at all, which the substring check rejects without the regex.
     for text in texts:
-        if text and NSFW_PAREN_RE.search(str(text)):
+        if not text:
+            continue
+        if not isinstance(text, str):
+            text = str(text)
+        if "(" in text and _NSFW_SEARCH(text):
             return True
     return False
 
@@ -268,6 +281,100 @@ async def fetch_parsed_feed_async(session: Any, feed_url: str, *, semaphore: Any
     return parsed
 
 
+class BoundedJobPool:
+    """Run handler(*job) on a fixed pool of workers while jobs are still added.
+
+    Only `workers` coroutines exist at a time however many jobs are queued.
+    The workers start as soon as the pool exists, so jobs queued early run
+    while the caller keeps producing more (e.g. while later hosts' feeds are
+    fetched). results() closes the pool and returns the results in add()
+    order, the same as asyncio.gather().
+    """
+
+    def __init__(self, handler: Any, *, workers: int) -> None:
+        self._handler = handler
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._results: list[Any] = []
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(max(1, workers))]
+
+    def add(self, *job: Any) -> None:
+        self._queue.put_nowait((len(self._results), job))
+        self._results.append(None)
+
+    async def _worker(self) -> None:
+        while True:
+            entry = await self._queue.get()
+            if entry is None:
+                return
+            index, job = entry
+            self._results[index] = await self._handler(*job)
+
+    async def results(self) -> list[Any]:
+        for _ in self._workers:
+            self._queue.put_nowait(None)
+        await asyncio.gather(*self._workers)
+        return self._results
+
+
+# Keep resolved addresses and idle sockets for the length of a run: every
+# novel of a host hits the same origin, so DNS and TLS setup are paid once.
+FETCH_DNS_CACHE_SECONDS = 300
+FETCH_KEEPALIVE_SECONDS = 30
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=300, sock_connect=15)
+
+
+def fetch_per_host_limit(default: int = 8) -> int:
+    """Return the per-host connection cap for generator sessions.
+
+    Priority:
+      1. FETCH_PER_HOST_LIMIT env
+      2. config/runtime.json per_host_fetch_limit
+      3. default
+    """
+
+    value = _safe_int(str(os.getenv("FETCH_PER_HOST_LIMIT", "") or "").strip())
+    if value is None:
+        value = _first_runtime_int(get_runtime_fetch_config(), ("per_host_fetch_limit",))
+    if value is None:
+        value = default
+    return max(1, int(value))
+
+
+def fetch_client_session(concurrency: int) -> aiohttp.ClientSession:
+    """Return the shared ClientSession for one generator run.
+
+    Total connections are capped at the configured fetch `concurrency`, so
+    lowering FREE_/PAID_FETCH_CONCURRENCY still bounds the whole run. Any
+    single host is further capped at fetch_per_host_limit(); that only
+    bites when the concurrency is raised above it.
+    """
+
+    limit = max(1, int(concurrency))
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=min(fetch_per_host_limit(), limit),
+        ttl_dns_cache=FETCH_DNS_CACHE_SECONDS,
+        keepalive_timeout=FETCH_KEEPALIVE_SECONDS,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=FETCH_TIMEOUT)
+
+
+def run_async_main(main: Any) -> Any:
+    """Run a generator's main coroutine, on uvloop when it is installed.
+
+    uvloop is an optional speed-up for the aiohttp socket work (it is not
+    available on Windows); without it this is plain asyncio.run().
+    """
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main())
+
+    # requirements.txt pins uvloop>=0.18, the first release with uvloop.run().
+    return uvloop.run(main())
+
+
 def parsed_feed_fetch_ok(parsed_feed: Any) -> bool:
     """Return whether an async feed request produced a usable feed document.
 
@@ -697,18 +804,6 @@ def should_skip_completed(
 
 # ---------------- Shared Feed Sorting ----------------
 
-def _normalized_pubdate(item):
-    dt = getattr(item, "pubDate", None)
-
-    if not isinstance(dt, datetime.datetime):
-        return datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
-
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=datetime.timezone.utc)
-
-    return dt.astimezone(datetime.timezone.utc).replace(microsecond=0)
-
-
 def _novel_alpha_sort_key(item):
     return (
         getattr(item, "host", "").casefold(),
@@ -716,12 +811,24 @@ def _novel_alpha_sort_key(item):
     )
 
 
-def _chapter_sort_key(item):
+def _no_chapter_num(_chapter):
+    return (0,)
+
+
+def _chapter_sort_key_for(items):
+    """Return a chapter-number sort key with each host's parser looked up once."""
+
     from host_utils import get_host_utils
 
-    return get_host_utils(getattr(item, "host", "")).get(
-        "chapter_num", lambda s: (0,)
-    )(getattr(item, "chapter", ""))
+    chapter_num_by_host = {
+        host: get_host_utils(host).get("chapter_num", _no_chapter_num)
+        for host in {getattr(item, "host", "") for item in items}
+    }
+
+    def key(item):
+        return chapter_num_by_host[getattr(item, "host", "")](getattr(item, "chapter", ""))
+
+    return key
 
 
 def sort_feed_items(items):
@@ -731,12 +838,25 @@ def sort_feed_items(items):
     Tie-breakers:
       1. host/title alphabetical
       2. chapter number newest first within the same novel/date
+
+    pubDate is compared as-is: both generators build it as an aware
+    datetime with whole seconds, so no per-item normalisation is needed.
     """
+    # Work out every key once per item up front; the three stable passes
+    # below then only index into the decorated rows.
+    chapter_sort_key = _chapter_sort_key_for(items)
+    decorated = [
+        (item.pubDate, _novel_alpha_sort_key(item), chapter_sort_key(item), item)
+        for item in items
+    ]
+
     # weakest tie-breaker first
-    items.sort(key=_chapter_sort_key, reverse=True)
+    decorated.sort(key=itemgetter(2), reverse=True)
 
     # then alphabetical novel tie-breaker
-    items.sort(key=_novel_alpha_sort_key)
+    decorated.sort(key=itemgetter(1))
 
     # strongest sort last
-    items.sort(key=_normalized_pubdate, reverse=True)
+    decorated.sort(key=itemgetter(0), reverse=True)
+
+    items[:] = [row[3] for row in decorated]
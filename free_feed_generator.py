@@ -1,6 +1,5 @@
 import datetime
 import asyncio
-import aiohttp
 import feedparser
 import PyRSS2Gen
 import xml.dom.minidom
@@ -13,6 +12,7 @@ from feed_common import (
     chapter_source_mode,
     entry_matches_chapter_type,
     feed_looks_capped_at_current_batch,
+    fetch_client_session,
     fetch_parsed_feed_async,
     has_nsfw_marker,
     host_level_feed_url,
@@ -21,6 +21,7 @@ from feed_common import (
     parsed_feed_fetch_error,
     parsed_feed_fetch_ok,
     resolved_novel_feed_url,
+    run_async_main,
     should_skip_completed,
     sort_feed_items,
     write_feed_fallback_report,
@@ -61,49 +62,57 @@ class MyRSSItem(PyRSS2Gen.RSSItem):
         super().__init__(*args, **kwargs)
     
     def writexml(self, writer, indent="", addindent="", newl=""):
-        writer.write(indent + "  <item>" + newl)
+        # Runs once per item: bind the writer method and the item padding
+        # to locals instead of re-resolving them on every line.
+        write = writer.write
+        esc = escape
+        pad = indent + "    "
+        title = self.title
+        host = self.host
+
+        write(indent + "  <item>" + newl)
 
         # <title> is the novel title, not chapter
-        writer.write(indent + "    <title>%s</title>" % escape(self.title) + newl)
+        write(pad + "<title>%s</title>" % esc(title) + newl)
 
-        writer.write(indent + "    <volume>%s</volume>" % escape(self.volume) + newl)
-        writer.write(indent + "    <chapter>%s</chapter>" % escape(self.chapter) + newl)
+        write(pad + "<volume>%s</volume>" % esc(self.volume) + newl)
+        write(pad + "<chapter>%s</chapter>" % esc(self.chapter) + newl)
 
         chaptername = self.chaptername.strip()
-        writer.write(indent + "    <chaptername>%s</chaptername>" % escape(chaptername) + newl)
+        write(pad + "<chaptername>%s</chaptername>" % esc(chaptername) + newl)
 
-        writer.write(indent + "    <link>%s</link>" % escape(self.link) + newl)
+        write(pad + "<link>%s</link>" % esc(self.link) + newl)
 
         # description goes in CDATA
-        writer.write(indent + "    <description><![CDATA[%s]]></description>" % self.description + newl)
+        write(pad + "<description><![CDATA[%s]]></description>" % self.description + newl)
         
         # ── category: per-chapter detection OR whole-novel mapping
         nsfw_list = get_nsfw_novels()
-        is_nsfw = bool(self.is_nsfw) or (self.title in nsfw_list)
-        writer.write(indent + "    <category>%s</category>" % ("NSFW" if is_nsfw else "SFW") + newl)
+        is_nsfw = bool(self.is_nsfw) or (title in nsfw_list)
+        write(pad + "<category>%s</category>" % ("NSFW" if is_nsfw else "SFW") + newl)
         
-        translator = get_translator(self.host, self.title)
-        writer.write(indent + "    <translator>%s</translator>" % escape(translator) + newl)
+        translator = get_translator(host, title)
+        write(pad + "<translator>%s</translator>" % esc(translator) + newl)
         
-        short_code = get_novel_short_code(self.title, self.host)
-        writer.write(indent + "    <short_code>%s</short_code>" % escape(short_code) + newl)
+        short_code = get_novel_short_code(title, host)
+        write(pad + "<short_code>%s</short_code>" % esc(short_code) + newl)
         
-        writer.write(indent + '    <featuredImage url="%s"/>' % escape(get_featured_image(self.title, self.host)) + newl)
+        write(pad + '<featuredImage url="%s"/>' % esc(get_featured_image(title, host)) + newl)
         
-        writer.write(
-            indent + "    <pubDate>%s</pubDate>" %
+        write(
+            pad + "<pubDate>%s</pubDate>" %
             self.pubDate.strftime("%a, %d %b %Y %H:%M:%S +0000") + newl
         )
         
-        writer.write(indent + "    <host>%s</host>" % escape(self.host) + newl)
-        writer.write(indent + '    <hostLogo url="%s"/>' % escape(get_host_logo(self.host)) + newl)
+        write(pad + "<host>%s</host>" % esc(host) + newl)
+        write(pad + '<hostLogo url="%s"/>' % esc(get_host_logo(host)) + newl)
         
-        writer.write(
-            indent + '    <guid isPermaLink="%s">%s</guid>' %
+        write(
+            pad + '<guid isPermaLink="%s">%s</guid>' %
             (str(self.guid.isPermaLink).lower(), self.guid.guid) + newl
         )
 
-        writer.write(indent + "  </item>" + newl)
+        write(indent + "  </item>" + newl)
 
 class CustomRSS2(PyRSS2Gen.RSS2):
     def writexml(self, writer, indent="", addindent="", newl=""):
@@ -140,8 +149,9 @@ class CustomRSS2(PyRSS2Gen.RSS2):
         if hasattr(self, 'ttl') and self.ttl is not None:
             writer.write(indent + addindent + "<ttl>%s</ttl>" % escape(str(self.ttl)) + newl)
 
+        item_indent = indent + addindent
         for item in self.items:
-            item.writexml(writer, indent + addindent, addindent, newl)
+            item.writexml(writer, item_indent, addindent, newl)
 
         writer.write(indent + "</channel>" + newl)
         writer.write("</rss>" + newl)
@@ -153,7 +163,7 @@ def entry_pub_date(entry):
         return datetime.datetime(*tt[:6], tzinfo=datetime.timezone.utc)
 
     # very rare: some feeds omit dates — fall back to "now" so we don't crash
-    return datetime.datetime.now(datetime.timezone.utc)
+    return datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
 
 
 def append_free_entry_item(rss_items, host, utils, entry, *, forced_title="", forced_details=None):
@@ -243,6 +253,8 @@ def build_free_item(host, novel_title, details, chap):
         pub_date = datetime.datetime.now(datetime.timezone.utc)
     if pub_date.tzinfo is None:
         pub_date = pub_date.replace(tzinfo=datetime.timezone.utc)
+    # sort_feed_items compares pubDate as-is, at whole-second precision.
+    pub_date = pub_date.replace(microsecond=0)
 
     link = str(chap.get("link", "") or "").strip()
     guid = str(chap.get("guid") or chap.get("id") or link or f"{host}:{novel_title}:{raw_chapter}:{raw_chaptername}")
@@ -470,8 +482,7 @@ async def main_async():
     # Loaded only if we actually hit a novel-scoped source.
     completion_state = None
 
-    connector = aiohttp.TCPConnector(limit=_free_fetch_concurrency())
-    async with aiohttp.ClientSession(connector=connector) as session:
+    async with fetch_client_session(_free_fetch_concurrency()) as session:
         tasks = []
 
         # Loop over each host defined in the mapping.
@@ -662,4 +673,4 @@ async def main_async():
     print("Output written to", output_file)
 
 if __name__ == "__main__":
-    asyncio.run(main_async())
\ No newline at end of file
+    run_async_main(main_async)
\ No newline at end of file
@@ -1,10 +1,11 @@
 import re
+import asyncio
 import datetime
 from urllib.parse import urlparse, unquote
 from html import unescape
 import aiohttp
 import feedparser
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from novel_mappings import HOSTING_SITE_DATA
 
@@ -25,6 +26,21 @@ UA_STR = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, l
 DEFAULT_HEADERS = {"User-Agent": UA_STR}
 AIOHTTP_TIMEOUT = aiohttp.ClientTimeout(total=20)  # if using aiohttp
 
+# Transient failures (rate limits, gateway errors, dropped connections) are
+# retried with exponential backoff instead of dropping the novel for this run.
+FETCH_ATTEMPTS = 4
+FETCH_RETRY_DELAY = 0.5  # seconds, doubled after each failed attempt
+FETCH_RETRY_MAX_WAIT = 60  # never sleep longer than this, even if Retry-After asks
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Patterns applied per chapter row / per sort key, compiled once.
+_CHAP_HEAD_RE = re.compile(r"\s*([^<]+)")
+_CHAP_SUBTITLE_RE = re.compile(r"</i>\s*[-–]\s*(.+)")
+_PAID_ICON_RE = re.compile(r"<i[^>]*>.*?</i>", re.DOTALL)
+_CHAPTER_EXTRA_RE = re.compile(r"chapter\s+extra\s+(\d+)")
+_EXTRA_RE = re.compile(r"\bextra\s+(\d+)")
+_NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+
 # =============================================================================
 # DRAGONHOLIC PAID UPDATE CHECK / SCRAPE
 # =============================================================================
@@ -46,22 +62,59 @@ def tune_paid_pubdate(source: str, dt: datetime.datetime) -> datetime.datetime:
         dt = dt.replace(tzinfo=datetime.timezone.utc)
     return dt
     
-async def fetch_page(session: aiohttp.ClientSession, url: str) -> str:
+def _retry_after_seconds(resp, default: float) -> float:
+    raw = (resp.headers.get("Retry-After") or "").strip()
     try:
-        async with session.get(url, headers=DEFAULT_HEADERS, timeout=AIOHTTP_TIMEOUT) as resp:
-            if resp.status != 200:
-                print(f"⚠️  {url} returned HTTP {resp.status}")
+        return max(0.0, float(raw))
+    except ValueError:
+        return default
+
+
+async def fetch_page(session: aiohttp.ClientSession, url: str, attempts: int = FETCH_ATTEMPTS) -> str:
+    delay = FETCH_RETRY_DELAY
+    for attempt in range(1, attempts + 1):
+        try:
+            async with session.get(url, headers=DEFAULT_HEADERS, timeout=AIOHTTP_TIMEOUT) as resp:
+                if resp.status == 200:
+                    return await resp.text()
+                if resp.status not in RETRY_STATUSES or attempt == attempts:
+                    print(f"⚠️  {url} returned HTTP {resp.status}")
+                    return ""
+                wait = _retry_after_seconds(resp, delay)
+                reason = f"HTTP {resp.status}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if attempt == attempts:
+                print(f"⚠️  Network error fetching {url}: {e}")
                 return ""
-            return await resp.text()
-    except Exception as e:
-        print(f"⚠️  Network error fetching {url}: {e}")
-        return ""
+            wait = delay
+            reason = str(e) or type(e).__name__
+        except Exception as e:
+            print(f"⚠️  Network error fetching {url}: {e}")
+            return ""
+
+        wait = min(wait, FETCH_RETRY_MAX_WAIT)
+        print(f"⚠️  {url} failed ({reason}); retry {attempt}/{attempts - 1} in {wait:g}s")
+        await asyncio.sleep(wait)
+        delay *= 2
+
+    return ""
+
+# The update check only looks at chapter rows, so the parser can skip
+# building the rest of the page tree. (Filtering on the multi-valued class
+# attribute inside the strainer is unreliable across bs4 versions, so the
+# class match stays in the find() call.)
+CHAPTER_LI_STRAINER = SoupStrainer("li")
+
 
 def clean_description(raw_desc: str) -> str:
-    soup = BeautifulSoup(raw_desc, "html.parser")
-    for div in soup.select("div.c-content-readmore"):
+    return clean_description_tag(BeautifulSoup(raw_desc, "html.parser"))
+
+
+def clean_description_tag(tag) -> str:
+    """clean_description() for an already-parsed tag, without re-parsing its HTML."""
+    for div in tag.select("div.c-content-readmore"):
         div.decompose()
-    text_html = soup.decode_contents()
+    text_html = tag.decode_contents()
     return re.sub(r"\s+", " ", text_html).strip()
 
 
@@ -105,7 +158,7 @@ async def novel_has_paid_update_async(session, novel_url: str) -> bool:
     if not html:
         return False
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "html.parser", parse_only=CHAPTER_LI_STRAINER)
     li = soup.find("li", class_="wp-manga-chapter")
     if not li:
         return False
@@ -165,7 +218,7 @@ async def scrape_paid_chapters_async(session, novel_url: str, host: str):
 
     # summary for <description>
     main_desc_div = soup.select_one("div.description-summary")
-    main_desc = clean_description(main_desc_div.decode_contents()) if main_desc_div else ""
+    main_desc = clean_description_tag(main_desc_div) if main_desc_div else ""
 
     paid_items = []
     now_utc = datetime.datetime.now(datetime.timezone.utc)
@@ -191,11 +244,11 @@ async def scrape_paid_chapters_async(session, novel_url: str, host: str):
         raw_html = a.decode_contents()
 
         # the first text before any tags is usually "Chapter X"
-        m1 = re.match(r"\s*([^<]+)", raw_html)
+        m1 = _CHAP_HEAD_RE.match(raw_html)
         chap_name = m1.group(1).strip() if m1 else raw_html.strip()
 
         # anything after </i> - ... is the subtitle
-        m2 = re.search(r"</i>\s*[-–]\s*(.+)", raw_html)
+        m2 = _CHAP_SUBTITLE_RE.search(raw_html)
         nameext = m2.group(1).strip() if m2 else ""
 
         href = a.get("href", "").strip()
@@ -281,7 +334,7 @@ def extract_volume_dragonholic(full_title: str, link: str) -> str:
 # =============================================================================
 
 def split_paid_chapter_dragonholic(raw_title: str):
-    cleaned = re.sub(r"<i[^>]*>.*?</i>", "", raw_title, flags=re.DOTALL).strip()
+    cleaned = _PAID_ICON_RE.sub("", raw_title).strip()
     parts = cleaned.split(" - ", 1)
     if len(parts) == 2:
         return parts[0].strip(), parts[1].strip()
@@ -388,14 +441,14 @@ def chapter_num(name: str):
     s = (name or '').lower()
 
     # Extras → very large rank so they come after normal chapters
-    m = re.search(r'chapter\s+extra\s+(\d+)', s)
+    m = _CHAPTER_EXTRA_RE.search(s)
     if not m:
-        m = re.search(r'\bextra\s+(\d+)', s)
+        m = _EXTRA_RE.search(s)
     if m:
         return (10**9, int(m.group(1)))  # extras at the end
 
     # Normal numeric (supports decimals like 12.5)
-    nums = re.findall(r"\d+(?:\.\d+)?", name)
+    nums = _NUM_RE.findall(name)
     if not nums:
         return (0,)
     out = []
@@ -114,6 +114,10 @@ COIN_MANUAL_DEFAULT = os.getenv("MISTMINT_MANUAL_COIN", "5").strip()
 
 DIAG = {"counts": Counter(), "errors": [], "events": []}
 
+# Per-novel progress notices run inside the async scrape for every novel and
+# GitHub only surfaces the first few annotations per step, so they are opt-in.
+DIAG_VERBOSE = os.getenv("MISTMINT_DIAG_VERBOSE", "0").strip() == "1"
+
 def _gha(level: str, title: str, msg: str = ""):
     # levels: error, warning, notice
     print(f"::{level} title={title}::{msg}")
@@ -197,6 +201,8 @@ def _mistmint_mode() -> str:
     return "STATE" if _manual_mode_on() else "API"
 
 def _log_mistmint_mode(phase: str, novel_url: str = ""):
+    if not DIAG_VERBOSE:
+        return
     try:
         _gha("notice", "mistmint-mode", json.dumps({
             "phase": phase,
@@ -160,12 +160,13 @@ async def scrape_paid_chapters_mistmint_async(session, novel_url: str, host: str
                 diag_fail("mistmint-paid-scrape-http", url=api_url, code=resp.status)
                 return [], ""
             payload = await resp.json()
-            _gha("notice", "mistmint-paid-scrape-ok", json.dumps({
-                "url": api_url,
-                "status": resp.status,
-                "volumes": len((payload or {}).get("data", []) or []),
-                "chapters": sum(len(v.get("chapters") or []) for v in (payload or {}).get("data", []))
-            })[:300])
+            if DIAG_VERBOSE:
+                _gha("notice", "mistmint-paid-scrape-ok", json.dumps({
+                    "url": api_url,
+                    "status": resp.status,
+                    "volumes": len((payload or {}).get("data", []) or []),
+                    "chapters": sum(len(v.get("chapters") or []) for v in (payload or {}).get("data", []))
+                })[:300])
     except Exception as e:
         diag_fail("mistmint-paid-scrape-ex", url=api_url, error=str(e))
         return [], ""
@@ -1,19 +1,24 @@
-import re
 import datetime
 import asyncio
-import aiohttp
+import functools
 import feedparser
 import PyRSS2Gen
-import xml.dom.minidom
 import json
 import os
-from xml.sax.saxutils import escape
+from pathlib import Path
+
+try:
+    import orjson  # optional: faster history (de)serialisation
+except ImportError:
+    orjson = None
 from host_utils import get_host_utils
 from feed_common import (
+    _safe_int,
     chapter_fetch_concurrency,
     chapter_source_mode,
     entry_matches_chapter_type,
     feed_looks_capped_at_current_batch,
+    fetch_client_session,
     fetch_parsed_feed_async,
     has_nsfw_marker,
     host_level_feed_url,
@@ -22,6 +27,8 @@ from feed_common import (
     parsed_feed_fetch_error,
     parsed_feed_fetch_ok,
     resolved_novel_feed_url,
+    run_async_main,
+    BoundedJobPool,
     should_skip_completed,
     sort_feed_items,
     truthy,
@@ -44,7 +51,13 @@ from novel_mappings import (
 # ---------------- History Control ----------------
 PAID_HISTORY_PATH = os.getenv("PAID_HISTORY_PATH", "paid_history.json")
 USE_HISTORY = os.getenv("PAID_USE_HISTORY", "1") == "1"
-NSFW_PAREN_RE = re.compile(r'\([^)]*\b(?:nsfw|r-?18|18\+|h{1,3})\b[^)]*\)', re.I)
+# History is written newest first, so only the head of the file can still
+# make the 200-item feed; anything past this is never merged.
+PAID_HISTORY_MAX = max(1, _safe_int(os.getenv("PAID_HISTORY_MAX"), 500))
+
+# Tag chapters whose own text carries an NSFW marker. With this off, only
+# novels mapped as is_nsfw are categorised NSFW.
+USE_NSFW_MARKER = os.getenv("PAID_NSFW_MARKER", "1") == "1"
 
 
 def should_check_paid_novel(novel_title: str, details: dict, completion_state: dict) -> bool:
@@ -64,8 +77,10 @@ def should_check_paid_novel(novel_title: str, details: dict, completion_state: d
 def load_history():
     if not USE_HISTORY: return []
     try:
+        if orjson is not None:
+            return orjson.loads(Path(PAID_HISTORY_PATH).read_bytes())[:PAID_HISTORY_MAX]
         with open(PAID_HISTORY_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+            return json.load(f)[:PAID_HISTORY_MAX]
     except Exception:
         return []
 
@@ -73,6 +88,10 @@ def save_history(items):
     if not USE_HISTORY:
         return
     try:
+        if orjson is not None:
+            # Same layout as json.dump(..., ensure_ascii=False, indent=2).
+            Path(PAID_HISTORY_PATH).write_bytes(orjson.dumps(items, option=orjson.OPT_INDENT_2))
+            return
         with open(PAID_HISTORY_PATH, "w", encoding="utf-8") as f:
             json.dump(items, f, ensure_ascii=False, indent=2)
     except Exception:
@@ -82,19 +101,27 @@ def _dt_to_iso(dt: datetime.datetime) -> str:
     return dt.astimezone(datetime.timezone.utc).isoformat()
 
 def _iso_to_dt(s: str) -> datetime.datetime:
-    return datetime.datetime.fromisoformat(s.replace("Z", "+00:00"))
+    return _utc_pubdate(datetime.datetime.fromisoformat(s.replace("Z", "+00:00")))
+
+def _utc_pubdate(dt: datetime.datetime) -> datetime.datetime:
+    """Aware UTC datetime with whole seconds, the form sort_feed_items expects."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    elif dt.tzinfo is not datetime.timezone.utc:
+        dt = dt.astimezone(datetime.timezone.utc)
+    return dt.replace(microsecond=0) if dt.microsecond else dt
 
 def _paid_api_concurrency() -> int:
     return chapter_fetch_concurrency("paid", default=6)
 
-def item_to_dict(item: PyRSS2Gen.RSSItem):
+def item_to_dict(item: "MyRSSItem"):
     return {
         "title": item.title,
         "link": item.link,
         "description": item.description,
         "guid": getattr(item.guid, "guid", None) if isinstance(item.guid, PyRSS2Gen.Guid) else item.guid,
         "isPermaLink": getattr(item.guid, "isPermaLink", False) if isinstance(item.guid, PyRSS2Gen.Guid) else False,
-        "pubDate": _dt_to_iso(item.pubDate),
+        "pubDate": getattr(item, "_iso_pubDate", None) or _dt_to_iso(item.pubDate),
         "volume": getattr(item, "volume", ""),
         "chapter": getattr(item, "chapter", ""),
         "chaptername": getattr(item, "chaptername", ""),
@@ -104,7 +131,7 @@ def item_to_dict(item: PyRSS2Gen.RSSItem):
     }
 
 def dict_to_item(d):
-    return MyRSSItem(
+    item = MyRSSItem(
         title=d["title"],
         link=d["link"],
         description=d["description"],
@@ -117,10 +144,17 @@ def dict_to_item(d):
         host=d.get("host",""),
         is_nsfw=d.get("is_nsfw", False),
     )
+    # Unchanged history rows are saved back with the string they were read from.
+    item._iso_pubDate = d["pubDate"]
+    return item
 
 # ---------------- Concurrency Control ----------------
 semaphore = asyncio.Semaphore(_paid_api_concurrency())
 
+# Per-run single-flight cache of paid page scrapes, keyed by (host, novel_url).
+# Several mapped titles can resolve to the same page; they all await one fetch.
+_page_cache = {}
+
 def entry_pub_date(entry):
     tt = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
     if tt:
@@ -137,12 +171,10 @@ def build_paid_item(host, novel_title, chap):
     chaptername = raw_chaptername
     volume = chap.get("volume", "")
 
-    pub_date = chap["pubDate"]
-    if pub_date.tzinfo is None:
-        pub_date = pub_date.replace(tzinfo=datetime.timezone.utc)
+    pub_date = _utc_pubdate(chap["pubDate"])
 
     # Case-insensitive detection for "(NSFW)", "(18+)", "(H)", "(HH)", "(HHH)"
-    is_nsfw = has_nsfw_marker(
+    is_nsfw = USE_NSFW_MARKER and has_nsfw_marker(
         raw_chapter,
         raw_chaptername,
         chap.get("description", ""),
@@ -292,24 +324,34 @@ async def process_novel_paid_feed_async(session, host, novel_title, details, fee
 
 
 async def process_novel(session, host, novel_title):
-    async with semaphore:
-        novel_url = get_novel_url(novel_title, host)
-        print(f"Scraping: {novel_url}")
-        utils = get_host_utils(host)
-        scraper = utils.get("scrape_paid_chapters_async")
-        if not scraper:
-            print(f"No scrape_paid_chapters_async defined for host: {host}")
-            return []
-
-        # Paid API/source mode now mirrors free API mode:
-        # fetch/build once and let history/state/guid gates decide what is new.
-        try:
-            paid_chapters, _main_desc = await scraper(session, novel_url, host)
-        except Exception as exc:
-            print(f"Paid API scrape failed for {host} / {novel_title}: {exc}")
-            return []
-
-        return [build_paid_item(host, novel_title, chap) for chap in (paid_chapters or [])]
+    # Runs on the API job pool alongside feed fetches for later hosts; the
+    # scrape itself takes their semaphore, so both stay inside one limit.
+    novel_url = get_novel_url(novel_title, host)
+    print(f"Scraping: {novel_url}")
+    utils = get_host_utils(host)
+    scraper = utils.get("scrape_paid_chapters_async")
+    if not scraper:
+        print(f"No scrape_paid_chapters_async defined for host: {host}")
+        return []
+
+    # Paid API/source mode now mirrors free API mode:
+    # fetch/build once and let history/state/guid gates decide what is new.
+    key = (host, novel_url)
+    fut = _page_cache.get(key)
+    if fut is None:
+        async def _limited_scrape():
+            async with semaphore:
+                return await scraper(session, novel_url, host)
+
+        fut = asyncio.ensure_future(_limited_scrape())
+        _page_cache[key] = fut
+    try:
+        paid_chapters, _main_desc = await asyncio.shield(fut)
+    except Exception as exc:
+        print(f"Paid API scrape failed for {host} / {novel_title}: {exc}")
+        return []
+
+    return [build_paid_item(host, novel_title, chap) for chap in (paid_chapters or [])]
 
 
 def collect_novel_paid_feed_requests(host, data, completion_state):
@@ -335,28 +377,31 @@ def collect_novel_paid_feed_requests(host, data, completion_state):
 
 
 async def run_novel_paid_feed_requests(session, host, requests):
-    tasks = [
-        asyncio.create_task(
-            process_novel_paid_feed_async(session, host, novel_title, details, feed_url)
-        )
-        for novel_title, details, feed_url in requests
-    ]
-    return await asyncio.gather(*tasks) if tasks else []
+    # Only as many coroutines as the fetch semaphore admits are created at a
+    # time, instead of one task per mapped novel up front.
+    pool = BoundedJobPool(
+        functools.partial(process_novel_paid_feed_async, session),
+        workers=min(_paid_api_concurrency(), len(requests)),
+    )
+    for novel_title, details, feed_url in requests:
+        pool.add(host, novel_title, details, feed_url)
+    return await pool.results()
 
 
-def add_paid_api_tasks(
-    tasks,
-    session,
+def add_paid_api_jobs(
+    pool,
     host,
     data,
     completion_state,
     *,
     only_novels=None,
 ):
-    """Queue paid API fetches for one host.
+    """Queue paid API fetches for one host as (host, novel_title) jobs.
 
     Plain api mode and feed_api fallback both call this helper, so a fallback
     uses the same host adapter and mapped-novel filtering as normal API mode.
+    The pool's workers pick the jobs up straight away, so no coroutine is
+    created here for novels that are still waiting for a worker.
     """
 
     utils = get_host_utils(host)
@@ -378,7 +423,7 @@ def add_paid_api_tasks(
         if not should_check_paid_novel(novel_title, details, completion_state):
             continue
 
-        tasks.append(asyncio.create_task(process_novel(session, host, novel_title)))
+        pool.add(host, novel_title)
 
     if not any_api_novel:
         print(f"No paid API novels defined for host: {host}")
@@ -386,88 +431,195 @@ def add_paid_api_tasks(
     return completion_state
 
 
-class MyRSSItem(PyRSS2Gen.RSSItem):
-    def __init__(self, *args, volume="", chapter="", chaptername="", coin="", host="", is_nsfw=None, **kwargs):
+class MyRSSItem:
+    """Plain slotted record for one paid chapter.
+
+    The paid feed is rendered by make_item_renderer, so none of
+    PyRSS2Gen.RSSItem's generic element machinery is needed; items only
+    carry the fields the sort, history and renderer read.
+    """
+
+    __slots__ = (
+        "title", "link", "description", "guid", "_pubDate", "_iso_pubDate",
+        "volume", "chapter", "chaptername", "coin", "host", "is_nsfw",
+    )
+
+    def __init__(self, title=None, link=None, description=None, guid=None, pubDate=None,
+                 volume="", chapter="", chaptername="", coin="", host="", is_nsfw=None):
+        self.title       = title
+        self.link        = link
+        self.description = description
+        self.guid        = guid
+        self.pubDate     = pubDate
         self.volume      = volume
-        self.chapter = chapter
-        self.chaptername  = chaptername
+        self.chapter     = chapter
+        self.chaptername = chaptername
         self.coin        = coin
         self.host        = host
         self.is_nsfw     = is_nsfw
-        super().__init__(*args, **kwargs)
-
-    def writexml(self, writer, indent="", addindent="", newl=""):
-        writer.write(indent + "  <item>" + newl)
-        writer.write(indent + "    <title>%s</title>" % escape(self.title) + newl)
-        writer.write(indent + "    <volume>%s</volume>" % escape(self.volume) + newl)
-        writer.write(indent + "    <chapter>%s</chapter>" % escape(self.chapter) + newl)
-
-        formatted_chaptername = self.chaptername.strip()
-        writer.write(indent + "    <chaptername>%s</chaptername>" % escape(formatted_chaptername) + newl)
-
-        writer.write(indent + "    <link>%s</link>" % escape(self.link) + newl)
-        writer.write(indent + "    <description><![CDATA[%s]]></description>" % self.description + newl)
-
-        nsfw_list = get_nsfw_novels()
-        is_nsfw = bool(self.is_nsfw) or (self.title in nsfw_list)
-        writer.write(indent + "    <category>%s</category>" % ("NSFW" if is_nsfw else "SFW") + newl)
-
-        translator = get_translator(self.host, self.title)
-        writer.write(indent + "    <translator>%s</translator>" % escape(translator) + newl)
-
-        short_code = get_novel_short_code(self.title, self.host)
-        writer.write(indent + "    <short_code>%s</short_code>" % escape(short_code) + newl)
-
-        writer.write(indent + '    <featuredImage url="%s"/>' % escape(get_featured_image(self.title, self.host)) + newl)
-        if self.coin:
-            writer.write(indent + "    <coin>%s</coin>" % escape(str(self.coin)) + newl)
-
-        writer.write(indent + "    <pubDate>%s</pubDate>" %
-                     self.pubDate.strftime("%a, %d %b %Y %H:%M:%S +0000") + newl)
-
-        writer.write(indent + "    <host>%s</host>" % escape(self.host) + newl)
-        writer.write(indent + '    <hostLogo url="%s"/>' % escape(get_host_logo(self.host)) + newl)
-
-        writer.write(indent + "    <guid isPermaLink=\"%s\">%s</guid>" %
-                     (str(self.guid.isPermaLink).lower(), self.guid.guid) + newl)
-        writer.write(indent + "  </item>" + newl)
-
-class CustomRSS2(PyRSS2Gen.RSS2):
-    def writexml(self, writer, indent="", addindent="", newl=""):
-        writer.write('<?xml version="1.0" encoding="utf-8"?>' + newl)
-        writer.write(
-            '<rss xmlns:content="http://purl.org/rss/1.0/modules/content/" '
-            'xmlns:wfw="http://wellformedweb.org/CommentAPI/" '
-            'xmlns:dc="http://purl.org/dc/elements/1.1/" '
-            'xmlns:atom="http://www.w3.org/2005/Atom" '
-            'xmlns:sy="http://purl.org/rss/1.0/modules/syndication/" '
-            'xmlns:slash="http://purl.org/rss/1.0/modules/slash/" '
-            'xmlns:webfeeds="http://www.webfeeds.org/rss/1.0" '
-            'xmlns:georss="http://www.georss.org/georss" '
-            'xmlns:geo="http://www.w3.org/2003/01/geo/wgs84_pos#" '
-            'version="2.0">' + newl
+
+    @property
+    def pubDate(self):
+        return self._pubDate
+
+    @pubDate.setter
+    def pubDate(self, value):
+        # The cached history string belongs to the old value.
+        self._pubDate = value
+        self._iso_pubDate = None
+
+
+_WD = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MO = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _rfc822(dt):
+    """RFC-822 date in UTC, without going through locale-aware strftime."""
+    if dt.tzinfo is not None and dt.tzinfo is not datetime.timezone.utc:
+        dt = dt.astimezone(datetime.timezone.utc)
+    return (
+        f"{_WD[dt.weekday()]}, {dt.day:02d} {_MO[dt.month - 1]} {dt.year} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} +0000"
+    )
+
+
+# Same entities minidom wrote for text and attribute values (no &apos;).
+_XML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def _xml_text(value):
+    """Escape element text / attribute values in a single C-level pass."""
+    return value.translate(_XML_ESC) if value else ""
+
+
+def _leaf(tag, text, attrs=""):
+    """<tag>text</tag>, or <tag/> when empty (minidom's form for empty elements)."""
+    return f"<{tag}{attrs}>{text}</{tag}>" if text else f"<{tag}{attrs}/>"
+
+
+def make_item_renderer(host, indent="", newl="", nsfw_titles=None):
+    """Return render(item) -> str for items that belong to one host.
+
+    Everything that depends only on the host or the writer layout (indent,
+    newline, the escaped host name, the host logo) is baked into the
+    template once, so rendering an item is a single f-string. The
+    per-novel mapping fields are looked up once per title and reused for
+    every chapter of that novel.
+    """
+    if nsfw_titles is None:
+        nsfw_titles = frozenset(get_nsfw_novels())
+    pad = indent + "  "
+    item_open = f"{indent}<item>{newl}"
+    item_close = f"{indent}</item>{newl}"
+    host_block = (
+        f"{pad}{_leaf('host', _xml_text(host))}{newl}"
+        f'{pad}<hostLogo url="{_xml_text(get_host_logo(host))}"/>{newl}'
+    )
+    guid_attrs = {True: ' isPermaLink="true"', False: ' isPermaLink="false"'}
+    novel_blocks = {}
+
+    def novel_block(title):
+        block = novel_blocks.get(title)
+        if block is None:
+            block = novel_blocks[title] = (
+                f"{pad}{_leaf('translator', _xml_text(get_translator(host, title)))}{newl}"
+                f"{pad}{_leaf('short_code', _xml_text(get_novel_short_code(title, host)))}{newl}"
+                f'{pad}<featuredImage url="{_xml_text(get_featured_image(title, host))}"/>{newl}'
+            )
+        return block
+
+    # The helpers are bound as defaults so each lookup in the per-item
+    # f-string is a local read rather than a module-global one.
+    def render(item, leaf=_leaf, text=_xml_text, rfc822=_rfc822):
+        title = item.title
+        guid = item.guid
+        is_nsfw = bool(item.is_nsfw) or (title in nsfw_titles)
+        coin = f"{pad}<coin>{text(str(item.coin))}</coin>{newl}" if item.coin else ""
+        description = (
+            f"<description><![CDATA[{item.description}]]></description>"
+            if item.description else "<description/>"
         )
-        writer.write(indent + "<channel>" + newl)
-        writer.write(indent + addindent + "<title>%s</title>" % escape(self.title) + newl)
-        writer.write(indent + addindent + "<link>%s</link>" % escape(self.link) + newl)
-        writer.write(indent + addindent + "<description>%s</description>" % escape(self.description) + newl)
-        if hasattr(self, 'language') and self.language:
-            writer.write(indent + addindent + "<language>%s</language>" % escape(self.language) + newl)
-        if hasattr(self, 'lastBuildDate') and self.lastBuildDate:
-            writer.write(indent + addindent + "<lastBuildDate>%s</lastBuildDate>" %
-                         self.lastBuildDate.strftime("%a, %d %b %Y %H:%M:%S +0000") + newl)
-        if hasattr(self, 'docs') and self.docs:
-            writer.write(indent + addindent + "<docs>%s</docs>" % escape(self.docs) + newl)
-        if hasattr(self, 'generator') and self.generator:
-            writer.write(indent + addindent + "<generator>%s</generator>" % escape(self.generator) + newl)
-        if hasattr(self, 'ttl') and self.ttl is not None:
-            writer.write(indent + addindent + "<ttl>%s</ttl>" % escape(str(self.ttl)) + newl)
-
-        for item in self.items:
-            item.writexml(writer, indent + addindent, addindent, newl)
-
-        writer.write(indent + "</channel>" + newl)
-        writer.write("</rss>" + newl)
+        return (
+            f"{item_open}"
+            f"{pad}{leaf('title', text(title))}{newl}"
+            f"{pad}{leaf('volume', text(item.volume))}{newl}"
+            f"{pad}{leaf('chapter', text(item.chapter))}{newl}"
+            f"{pad}{leaf('chaptername', text(item.chaptername.strip()))}{newl}"
+            f"{pad}{leaf('link', text(item.link))}{newl}"
+            f"{pad}{description}{newl}"
+            f"{pad}<category>{'NSFW' if is_nsfw else 'SFW'}</category>{newl}"
+            f"{novel_block(title)}"
+            f"{coin}"
+            f"{pad}<pubDate>{rfc822(item.pubDate)}</pubDate>{newl}"
+            f"{host_block}"
+            f"{pad}{leaf('guid', text(guid.guid), guid_attrs[bool(guid.isPermaLink)])}{newl}"
+            f"{item_close}"
+        )
+
+    return render
+
+RSS_OPEN = (
+    '<rss xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+    'xmlns:wfw="http://wellformedweb.org/CommentAPI/" '
+    'xmlns:dc="http://purl.org/dc/elements/1.1/" '
+    'xmlns:atom="http://www.w3.org/2005/Atom" '
+    'xmlns:sy="http://purl.org/rss/1.0/modules/syndication/" '
+    'xmlns:slash="http://purl.org/rss/1.0/modules/slash/" '
+    'xmlns:webfeeds="http://www.webfeeds.org/rss/1.0" '
+    'xmlns:georss="http://www.georss.org/georss" '
+    'xmlns:geo="http://www.w3.org/2003/01/geo/wgs84_pos#" '
+    'version="2.0">'
+)
+# Channel boilerplate the feed has always carried (it used to come from
+# PyRSS2Gen.RSS2's defaults); kept so the published XML does not change.
+RSS_DOCS = "http://blogs.law.harvard.edu/tech/rss"
+RSS_GENERATOR = "PyRSS2Gen-1.1.0"
+
+
+def render_feed(items, *, title, link, description, last_build_date,
+                indent="  ", addindent="  ", newl="\n"):
+    """Return the paid feed document for `items` as one string.
+
+    The layout (declaration without encoding, self-closed empty elements,
+    &quot; in text) matches what the old minidom pretty-print pass
+    produced, so the published file is unchanged.
+    """
+    child = indent + addindent
+    parts = [
+        '<?xml version="1.0" ?>' + newl,
+        RSS_OPEN + newl,
+        indent + "<channel>" + newl,
+        child + _leaf("title", _xml_text(title)) + newl,
+        child + _leaf("link", _xml_text(link)) + newl,
+        child + _leaf("description", _xml_text(description)) + newl,
+    ]
+    if last_build_date:
+        parts.append(child + "<lastBuildDate>%s</lastBuildDate>" % _rfc822(last_build_date) + newl)
+    parts.append(child + "<docs>%s</docs>" % RSS_DOCS + newl)
+    parts.append(child + "<generator>%s</generator>" % RSS_GENERATOR + newl)
+
+    nsfw_titles = frozenset(get_nsfw_novels())
+    renderers = {
+        host: make_item_renderer(host, child, newl, nsfw_titles)
+        for host in {item.host for item in items}
+    }
+    parts.extend(renderers[item.host](item) for item in items)
+
+    parts.append(indent + "</channel>" + newl)
+    parts.append("</rss>" + newl)
+    return "".join(parts)
+
+def write_feed_file(output_file, items, **channel):
+    """Render and write the feed with a single write.
+
+    The renderer already emits the final indentation, so the document is
+    not re-parsed; only whitespace-only lines (e.g. blank lines inside a
+    CDATA description) are dropped, as the old pretty-print step did.
+    """
+    document = render_feed(items, **channel)
+
+    pretty = "\n".join([line for line in document.splitlines() if line.strip()])
+    Path(output_file).write_text(pretty, encoding="utf-8")
 
 async def main_async():
     # 1) scrape fresh items
@@ -477,22 +629,30 @@ async def main_async():
     # Clear stale state before this run. The workflow alert step reads the
     # final report from the same temporary path after generation completes.
     write_feed_fallback_report("paid", fallback_events)
+    _page_cache.clear()
+
+    # The history file is independent of the scrape, so read and parse it in
+    # a worker thread while the network requests run.
+    history_task = asyncio.create_task(asyncio.to_thread(load_history))
 
     # Loaded only when a novel-scoped source is needed.
     completion_state = None
 
-    connector = aiohttp.TCPConnector(limit=_paid_api_concurrency())
-    async with aiohttp.ClientSession(connector=connector) as session:
-        tasks = []
+    async with fetch_client_session(_paid_api_concurrency()) as session:
+        # API scrapes start as soon as a host queues them and overlap with
+        # the feed fetches of the hosts after it.
+        api_pool = BoundedJobPool(
+            functools.partial(process_novel, session),
+            workers=_paid_api_concurrency(),
+        )
 
         for host, data in HOSTING_SITE_DATA.items():
             mode = chapter_source_mode(host, "paid")
 
             # Plain API mode does not touch any feed source.
             if mode == "api":
-                completion_state = add_paid_api_tasks(
-                    tasks,
-                    session,
+                completion_state = add_paid_api_jobs(
+                    api_pool,
                     host,
                     data,
                     completion_state,
@@ -579,9 +739,8 @@ async def main_async():
                         f"[paid-feed] Scanning {len(api_novels)} mapped novel(s) "
                         "through paid API fallback."
                     )
-                    completion_state = add_paid_api_tasks(
-                        tasks,
-                        session,
+                    completion_state = add_paid_api_jobs(
+                        api_pool,
                         host,
                         data,
                         completion_state,
@@ -616,64 +775,68 @@ async def main_async():
                     "api_fallback_novels": api_novels,
                 })
 
-        if tasks:
-            results = await asyncio.gather(*tasks)
-            for items in results:
-                scraped.extend(items)
+        for items in await api_pool.results():
+            scraped.extend(items)
 
     report_path = write_feed_fallback_report("paid", fallback_events)
     if fallback_events and report_path.exists():
         print(f"[paid-feed] Fallback report written to {report_path}")
 
-    # 2) load previous history
-    old_items = [dict_to_item(x) for x in load_history()]
-
-    # 3) merge & de-dupe by GUID (new wins)
+    # 2) merge previous history and fresh items, de-duped by GUID (new wins),
+    #    keeping only the last 7 days. Stale entries are dropped before they
+    #    are merged; they still evict an older entry with the same GUID, as
+    #    when the whole set was merged first and filtered afterwards.
+    now_utc = datetime.datetime.now(datetime.timezone.utc)
+    seven_days_ago = now_utc - datetime.timedelta(days=7)
+    cutoff_iso = _dt_to_iso(seven_days_ago)[:19]
     merged = {}
 
     def key_for(it):
         return getattr(it.guid, "guid", None) if isinstance(it.guid, PyRSS2Gen.Guid) else it.guid or it.link
 
-    for it in old_items:
+    for d in await history_task:
+        # History dates are stored as UTC ISO strings, which order like the
+        # datetimes they encode, so old entries need no datetime at all.
+        pub_iso = d.get("pubDate", "")
+        if pub_iso.endswith("+00:00") and pub_iso[:19] < cutoff_iso:
+            merged.pop(d.get("guid") or d["link"], None)
+            continue
+        it = dict_to_item(d)
+        if it.pubDate < seven_days_ago:
+            merged.pop(key_for(it), None)
+            continue
         merged[key_for(it)] = it
     for it in scraped:
+        if it.pubDate < seven_days_ago:
+            merged.pop(key_for(it), None)
+            continue
         merged[key_for(it)] = it
 
-    # 4) keep last 7 days, sort, cap
-    now_utc = datetime.datetime.now(datetime.timezone.utc)
-    seven_days_ago = now_utc - datetime.timedelta(days=7)
-    kept = [it for it in merged.values() if it.pubDate >= seven_days_ago]
+    # 3) sort, cap
+    kept = list(merged.values())
 
     sort_feed_items(kept)
 
     kept = kept[:200]
 
-    # 5) save history back
-    save_history([item_to_dict(it) for it in kept])
+    # 4) save history back
+    await asyncio.to_thread(save_history, [item_to_dict(it) for it in kept])
 
-    # 6) publish RSS
-    feed = CustomRSS2(
+    # 5) publish RSS
+    output_file = "paid_chapters_feed.xml"
+    await asyncio.to_thread(
+        write_feed_file,
+        output_file,
+        kept,
         title="Aggregated Paid Chapters Feed",
         link="https://github.com/cannibal-turtle/",
         description="Aggregated RSS feed for paid chapters across mapped novels.",
-        lastBuildDate=now_utc,
-        items=kept
+        last_build_date=now_utc,
     )
 
-    output_file = "paid_chapters_feed.xml"
-    with open(output_file, "w", encoding="utf-8") as f:
-        feed.writexml(f, indent="  ", addindent="  ", newl="\n")
-
-    with open(output_file, "r", encoding="utf-8") as f:
-        xml_content = f.read()
-    dom = xml.dom.minidom.parseString(xml_content)
-    pretty = "\n".join([line for line in dom.toprettyxml(indent="  ").splitlines() if line.strip()])
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(pretty)
-
     print(f"Modified feed generated with {len(kept)} items.")
     print(f"Output written to {output_file}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main_async())
\ No newline at end of file
+    run_async_main(main_async)
\ No newline at end of file
@@ -10,6 +10,11 @@ from pathlib import Path
 
 import requests
 
+try:
+    import orjson  # optional: faster event parse / payload encode
+except ImportError:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
@@ -61,8 +66,11 @@ def _human_delta(secs: int) -> str:
 
 
 def main() -> None:
-    with open(EVENT_PATH, "r", encoding="utf-8") as f:
-        event = json.load(f)
+    if orjson is not None:
+        event = orjson.loads(Path(EVENT_PATH).read_bytes())
+    else:
+        with open(EVENT_PATH, "r", encoding="utf-8") as f:
+            event = json.load(f)
 
     client_payload = event.get("client_payload", {}) or {}
     event_type = event.get("action", "")
@@ -111,7 +119,10 @@ def main() -> None:
         "Content-Type": "application/json",
     }
 
-    r = requests.post(url, headers=headers, json=discord_payload, timeout=20)
+    if orjson is not None:
+        r = requests.post(url, headers=headers, data=orjson.dumps(discord_payload), timeout=20)
+    else:
+        r = requests.post(url, headers=headers, json=discord_payload, timeout=20)
     if r.status_code >= 300:
         raise SystemExit(f"Discord send failed: {r.status_code} {r.text}")
 
@@ -1,5 +1,5 @@
 # tools/audit_dead_host_utils.py
-import ast, re, sys, pathlib
+import ast, os, re, sys, pathlib
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 HOST = ROOT / "host_utils.py"  # adjust if you've already moved it
@@ -12,41 +12,55 @@ tree = ast.parse(src)
 # --- collect top-level function defs
 func_nodes = {n.name: n for n in tree.body if isinstance(n, ast.FunctionDef)}
 
-# --- grab the two dispatch dicts as text
-def extract_dict_text(name: str):
-    s = src.find(f"{name} =")
-    if s < 0: return ""
-    start = src.find("{", s)
-    depth = 0
-    for i in range(start, len(src)):
-        if src[i] == "{": depth += 1
-        elif src[i] == "}":
-            depth -= 1
-            if depth == 0:
-                return src[start:i+1]
-    return ""
-
-drag_text = extract_dict_text("DRAGONHOLIC_UTILS")
-mist_text = extract_dict_text("MISTMINT_UTILS")
-
-# --- exported function names (values inside the dicts)
-def exported_names(dtext: str):
-    return [val for _, val in re.findall(r'"([^"]+)"\s*:\s*([A-Za-z_][A-Za-z0-9_]*)', dtext)]
-
-exported = set(exported_names(drag_text) + exported_names(mist_text))
-
-# --- build a simple call graph inside host_utils.py
-def get_called_names(fn: ast.FunctionDef):
-    called = set()
-    for n in ast.walk(fn):
-        if isinstance(n, ast.Call):
-            if isinstance(n.func, ast.Name):
-                called.add(n.func.id)
-            elif isinstance(n.func, ast.Attribute):
-                called.add(n.func.attr)
-    return called
-
-graph = {name: get_called_names(node) for name, node in func_nodes.items()}
+# --- exported function names (values inside the two dispatch dicts)
+DISPATCH_DICTS = ("DRAGONHOLIC_UTILS", "MISTMINT_UTILS")
+
+def value_names(v):
+    # `"key": func` and `"key": func if flag else None` both export func
+    if isinstance(v, ast.Name):
+        return [v.id]
+    if isinstance(v, ast.IfExp):
+        return value_names(v.body) + value_names(v.orelse)
+    return []
+
+exported = set()
+for node in tree.body:
+    if (
+        isinstance(node, ast.Assign)
+        and isinstance(node.targets[0], ast.Name)
+        and node.targets[0].id in DISPATCH_DICTS
+        and isinstance(node.value, ast.Dict)
+    ):
+        for k, v in zip(node.value.keys, node.value.values):
+            if isinstance(k, ast.Constant) and isinstance(k.value, str):
+                exported.update(value_names(v))
+
+# --- build a simple call graph inside host_utils.py (one pass over the tree)
+# Only top-level functions are graph nodes; calls anywhere inside one
+# (nested defs included) count for it. Class bodies are not walked, so a
+# method never merges with a module function of the same name.
+class CallGraphBuilder(ast.NodeVisitor):
+    def __init__(self):
+        self.graph = {}
+        self.called = None
+
+    def visit_Module(self, node):
+        for child in node.body:
+            if isinstance(child, ast.FunctionDef):
+                self.called = self.graph[child.name] = set()
+                self.generic_visit(child)
+        self.called = None
+
+    def visit_Call(self, node):
+        if isinstance(node.func, ast.Name):
+            self.called.add(node.func.id)
+        elif isinstance(node.func, ast.Attribute):
+            self.called.add(node.func.attr)
+        self.generic_visit(node)
+
+builder = CallGraphBuilder()
+builder.visit(tree)
+graph = builder.graph
 
 # --- compute reachable from exported
 reachable = set()
@@ -60,12 +74,18 @@ while stack:
             stack.append(callee)
 
 # --- scan the rest of the repo for key usage like utils['x'] or utils.get("x")
+USE_RE = re.compile(r'utils(?:\[\s*["\']([A-Za-z0-9_]+)["\']\s*\]|\.get\(\s*["\']([A-Za-z0-9_]+)["\'])')
+
 used_keys = set()
-for path in ROOT.glob("*.py"):
-    if path.name == HOST.name: continue
-    text = read(path)
-    used_keys.update(re.findall(r'utils\[\s*["\']([A-Za-z0-9_]+)["\']\s*\]', text))
-    used_keys.update(re.findall(r'utils\.get\(\s*["\']([A-Za-z0-9_]+)["\']', text))
+with os.scandir(ROOT) as it:
+    for entry in it:
+        if not entry.name.endswith(".py") or entry.name == HOST.name: continue
+        with open(entry.path, "rb") as f:
+            raw = f.read()
+        # cheap byte check first; most scripts never touch utils[...] / utils.get(...)
+        if b"utils[" not in raw and b"utils.get(" not in raw: continue
+        for m in USE_RE.finditer(raw.decode("utf-8", "replace")):
+            used_keys.add(m.group(1) or m.group(2))
 
 # --- report
 all_defs = set(func_nodes)
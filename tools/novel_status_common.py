@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Chapter-status helpers shared by publish_novel_card.py and update_novel_card.py.
+
+Both tools fetch a novel's chapters API, flatten the volumes and work out
+whether the novel is completed and when the next/last free chapter goes live.
+"""
+from __future__ import annotations
+
+import os
+import re
+import sys
+import functools
+from operator import itemgetter
+from datetime import datetime, timezone
+from pathlib import Path
+
+import aiohttp
+from dateutil import parser as dateparser
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from novel_mappings import HOSTING_SITE_DATA
+
+try:
+    from ciso8601 import parse_datetime as _fast_iso
+except ImportError:
+    def _fast_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+# short_code -> (host, host data, title, novel)
+SHORT_CODE_INDEX = {}
+
+for _host, _hostdata in HOSTING_SITE_DATA.items():
+    for _title, _novel in _hostdata["novels"].items():
+        _code = str(_novel.get("short_code") or "").strip().upper()
+        if _code:
+            SHORT_CODE_INDEX.setdefault(_code, (_host, _hostdata, _title, _novel))
+
+async def fetch_api(session, url, cookie_env):
+    headers = {}
+    cookie = os.environ.get(cookie_env)
+    if cookie:
+        headers["Cookie"] = cookie
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as r:
+        r.raise_for_status()
+        return await r.json(content_type=None)
+
+def normalize_api(api):
+    if not api:
+        return []
+    if isinstance(api, dict):
+        return api.get("data", [])
+    if isinstance(api, list):
+        return api
+    return []
+
+def flatten_chapters(api):
+    volumes = normalize_api(api)
+
+    # Common shape: one volume whose chapters already come back in order.
+    if len(volumes) == 1 and isinstance(volumes[0], dict):
+        out = [ch for ch in volumes[0].get("chapters", []) if not ch.get("isHidden")]
+        keys = [(ch.get("order", 0), ch.get("createdAt", "")) for ch in out]
+        if all(a <= b for a, b in zip(keys, keys[1:])):
+            return out
+
+    keyed = []
+
+    for vol in volumes:
+        if not isinstance(vol, dict):
+            continue
+        for ch in vol.get("chapters", []):
+            if not ch.get("isHidden"):
+                keyed.append((ch.get("order", 0), ch.get("createdAt", ""), ch))
+
+    # order is safer than createdAt when present
+    keyed.sort(key=itemgetter(0, 1))
+    return [ch for _, _, ch in keyed]
+
+_CHAPTER_RE = re.compile(r"chapter\s+(\d+(\.\d+)?)(?:\b|[^0-9])", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=256)
+def _needle_re(needle: str):
+    return re.compile(rf"\b{re.escape(needle)}\b", re.IGNORECASE)
+
+def text_match(needle: str, haystack: str) -> bool:
+    if not needle or not haystack:
+        return False
+    return _needle_re(needle).search(haystack) is not None
+
+def _parse_iso(value: str) -> datetime:
+    try:
+        return _fast_iso(value)
+    except ValueError:
+        return dateparser.parse(value)
+
+def compute_status(chapters, last_chapter_text):
+    completed = False
+
+    last_chapter_text = (last_chapter_text or "").strip()
+
+    # ── Case 1: Chapter N
+    m = _CHAPTER_RE.match(last_chapter_text)
+    if m:
+        chapter_numbers = {str(c.get("chapterNumber", "")).strip() for c in chapters}
+        completed = m.group(1) in chapter_numbers
+
+    # ── Case 2: Extras / side stories / named chapters
+    else:
+        needle = last_chapter_text
+        if needle:
+            for c in chapters:
+                if (
+                    text_match(needle, c.get("chapterNumber") or "") or
+                    text_match(needle, c.get("title") or "")
+                ):
+                    completed = True
+                    break
+
+    # ── Next free chapter logic
+    now = datetime.now(timezone.utc)
+
+    free_dts = []
+    for c in chapters:
+        free_at = c.get("freeAt")
+        if not free_at:
+            continue
+
+        try:
+            free_dts.append(_parse_iso(free_at))
+        except Exception:
+            continue
+
+    next_free_dt = min((dt for dt in free_dts if dt > now), default=None)
+    last_free_dt = max((dt for dt in free_dts if dt <= now), default=None)
+
+    return completed, next_free_dt, last_free_dt
@@ -13,12 +13,12 @@ import json
 import re
 import traceback
 import requests
-from datetime import datetime, timezone
-from dateutil import parser as dateparser
+import aiohttp
 
 import discord
 
-from novel_mappings import HOSTING_SITE_DATA, get_novelupdates_url
+from novel_mappings import get_novelupdates_url
+from novel_status_common import SHORT_CODE_INDEX, compute_status, fetch_api, flatten_chapters
 from host_utils import get_host_utils
 from message_renderer import load_template_settings, render_message, to_discord_py_kwargs
 from message_settings import setting_str
@@ -65,6 +65,11 @@ THREAD_MAP_DEFAULT_PATH_OVERRIDE = (
     or "config/thread_id_map.json"
 )
 
+try:
+    import orjson  # optional: faster state file (de)serialisation
+except ImportError:
+    orjson = None
+
 try:
     import tomllib
 except ModuleNotFoundError:
@@ -90,25 +95,27 @@ EXTRA_DISCORD_INTEGRATION_OVERRIDE = os.getenv("EXTRA_DISCORD_INTEGRATION", "").
 
 # ---------------- utils ----------------
 
+def _dump_state(state) -> bytes:
+    if orjson is not None:
+        # Same layout as json.dumps(..., indent=2) for this ASCII-only file.
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    return json.dumps(state, indent=2).encode("utf-8")
+
 def load_state():
     try:
-        with open(STATE_FILE, encoding="utf-8") as f:
-            return json.load(f)
+        with open(STATE_FILE, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return {}
 
 def save_state(state):
-    with open(STATE_FILE, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2)
-
-def fetch_api(url, cookie_env):
-    headers = {}
-    cookie = os.environ.get(cookie_env)
-    if cookie:
-        headers["Cookie"] = cookie
-    r = requests.get(url, headers=headers, timeout=15)
-    r.raise_for_status()
-    return r.json()
+    # Write to a temp file and swap it in, so an interrupted run never leaves
+    # a truncated state file behind.
+    tmp = STATE_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_dump_state(state))
+    os.replace(tmp, STATE_FILE)
 
 _THREAD_ID_MAP_CACHE = {}
 
@@ -448,115 +455,6 @@ def resolve_forum_post_id(host, short_code):
     thread_map = fetch_thread_id_map(integration, route)
     return thread_map.get(short_code.upper())
 
-def normalize_api(api):
-    if not api:
-        return []
-    if isinstance(api, dict):
-        return api.get("data", [])
-    if isinstance(api, list):
-        return api
-    return []
-
-def flatten_chapters(api):
-    volumes = normalize_api(api)
-    out = []
-
-    for vol in volumes:
-        if not isinstance(vol, dict):
-            continue
-        for ch in vol.get("chapters", []):
-            if not ch.get("isHidden"):
-                out.append(ch)
-
-    # order is safer than createdAt when present
-    out.sort(key=lambda c: (
-        c.get("order", 0),
-        c.get("createdAt", "")
-    ))
-    return out
-
-def human_delta(dt):
-    if not dt:
-        return "Unknown"
-    now = datetime.now(timezone.utc)
-    delta = dt - now
-    if delta.total_seconds() <= 0:
-        return "Available now"
-    d, s = delta.days, delta.seconds
-    h = s // 3600
-    m = (s % 3600) // 60
-    parts = []
-    if d:
-        parts.append(f"{d}d")
-    if h:
-        parts.append(f"{h}h")
-    if m and not d:
-        parts.append(f"{m}m")
-    return " ".join(parts)
-
-def text_match(needle: str, haystack: str) -> bool:
-    if not needle or not haystack:
-        return False
-    return re.search(
-        rf"\b{re.escape(needle)}\b",
-        haystack,
-        flags=re.IGNORECASE
-    ) is not None
-
-def compute_status(chapters, last_chapter_text):
-    completed = False
-    next_free_dt = None
-    last_free_dt = None
-
-    last_chapter_text = (last_chapter_text or "").strip()
-
-    # ── Case 1: Chapter N
-    m = re.match(
-        r"chapter\s+(\d+(\.\d+)?)(?:\b|[^0-9])",
-        last_chapter_text,
-        re.IGNORECASE
-    )
-    if m:
-        target_num = m.group(1)
-        for c in chapters:
-            if str(c.get("chapterNumber", "")).strip() == target_num:
-                completed = True
-                break
-
-    # ── Case 2: Extras / side stories / named chapters
-    else:
-        needle = last_chapter_text
-        if needle:
-            for c in chapters:
-                if (
-                    text_match(needle, c.get("chapterNumber") or "") or
-                    text_match(needle, c.get("title") or "")
-                ):
-                    completed = True
-                    break
-
-    # ── Next free chapter logic
-    now = datetime.now(timezone.utc)
-
-    for c in chapters:
-        free_at = c.get("freeAt")
-        if not free_at:
-            continue
-
-        try:
-            dt = dateparser.parse(free_at)
-        except Exception:
-            continue
-
-        if dt > now:
-            if not next_free_dt or dt < next_free_dt:
-                next_free_dt = dt
-        else:
-            if not last_free_dt or dt > last_free_dt:
-                last_free_dt = dt
-
-    return completed, next_free_dt, last_free_dt
-
 def build_status_text(*, completed, next_free_dt, last_free_dt):
     status_lines = []
 
@@ -602,30 +500,19 @@ def build_message_payload_for_channel(
     title,
     novel,
     host,
-    completed,
-    next_free_dt,
-    last_free_dt,
+    status_text,
+    links_text,
     target_channel_id,
     target_integration,
-    forum_post_url,
     novel_role_mention,
 ):
     """
     Builds the same novel-card message as before, but with the visible text/layout
     moved to message_templates/publish_novel_card.toml.
-    """
-    status_text = build_status_text(
-        completed=completed,
-        next_free_dt=next_free_dt,
-        last_free_dt=last_free_dt,
-    )
-
-    links_text = build_links_text(
-        novel=novel,
-        host=host,
-        forum_post_url=forum_post_url,
-    )
 
+    status_text and links_text do not depend on the target, so the caller
+    builds them once per novel.
+    """
     # Role IDs are server-specific. Only show the Role field if this target
     # integration's own novel_discord_map.toml had a role for this novel.
     show_role = bool(target_integration and novel_role_mention)
@@ -708,130 +595,141 @@ async def build_forum_post_url(forum_post_id):
 async def _publish_novel_card():
     state = load_state()
 
-    for host, hostdata in HOSTING_SITE_DATA.items():
-        for title, novel in hostdata["novels"].items():
-            print("Checking:", novel.get("short_code"))
+    entry = SHORT_CODE_INDEX.get(SHORT_CODE)
+
+    if not entry:
+        print("Novel not found in mappings.")
+        await bot.close()
+        return
+
+    host, hostdata, title, novel = entry
 
-            if novel.get("short_code", "").upper() != SHORT_CODE:
-                continue
+    utils = get_host_utils(host)
+    resolve_api_url = utils.get("resolve_chapters_api_url")
 
-            utils = get_host_utils(host)
-            resolve_api_url = utils.get("resolve_chapters_api_url")
+    if not resolve_api_url:
+        print(f"❌ Host {host} does not support resolve_chapters_api_url.")
+        await bot.close()
+        return
+
+    api_url = resolve_api_url(hostdata, title, novel)
 
-            if not resolve_api_url:
-                print(f"❌ Host {host} does not support resolve_chapters_api_url.")
-                continue
+    if not api_url:
+        print(f"❌ No chapters_api_url found for {host} / {title}")
+        await bot.close()
+        return
 
-            api_url = resolve_api_url(hostdata, title, novel)
+    async with aiohttp.ClientSession() as session:
+        api = await fetch_api(session, api_url, hostdata["token_secret"])
+    chapters = flatten_chapters(api)
 
-            if not api_url:
-                print(f"❌ No chapters_api_url found for {host} / {title}")
-                continue
+    completed, next_free_dt, last_free_dt = compute_status(
+        chapters,
+        novel.get("last_chapter"),
+    )
 
-            api = fetch_api(api_url, hostdata["token_secret"])
-            chapters = flatten_chapters(api)
+    # Get the forum/thread ID from this host's configured Discord target, if any.
+    forum_post_id = resolve_forum_post_id(host, SHORT_CODE)
 
-            completed, next_free_dt, last_free_dt = compute_status(
-                chapters,
-                novel.get("last_chapter"),
+    if not forum_post_id:
+        print(f"Warning: no forum/thread ID found for {SHORT_CODE} in this host's configured Discord target.")
+
+    forum_post_url = await build_forum_post_url(forum_post_id)
+
+    status_text = build_status_text(
+        completed=completed,
+        next_free_dt=next_free_dt,
+        last_free_dt=last_free_dt,
+    )
+
+    links_text = build_links_text(
+        novel=novel,
+        host=host,
+        forum_post_url=forum_post_url,
+    )
+
+    # Always post to the primary/private archive.
+    # Also post to the host/server archive when integrations.json points
+    # this host to a Discord repo whose server.json has novel_cards_archive.
+    # If a second channel/thread ID is passed manually, treat it as an
+    # extra override/testing target. Each target resolves its role field
+    # from the Discord integration that owns that channel/server.
+    target_posts = [
+        {
+            "channel_id": ARCHIVE_CHANNEL_ID,
+            "preferred_integration": DISCORD_INTEGRATION,
+        }
+    ]
+
+    host_archive_target = host_novel_cards_archive_target(host)
+
+    if host_archive_target:
+        target_posts.append(host_archive_target)
+
+    if EXTRA_CHANNEL_ID:
+        target_posts.append({
+            "channel_id": EXTRA_CHANNEL_ID,
+            "preferred_integration": host_discord_integration_for_host(host),
+        })
+
+    # Avoid duplicate posts while preserving target integration hints.
+    unique_posts = []
+    seen_channel_ids = set()
+
+    for post in target_posts:
+        channel_id = int(post["channel_id"])
+        if channel_id in seen_channel_ids:
+            continue
+        seen_channel_ids.add(channel_id)
+        unique_posts.append(post)
+
+    entries = state.setdefault(SHORT_CODE, [])
+    posted_channel_ids = {str(item.get("channel_id")) for item in entries}
+    posted_keys = {(str(item.get("channel_id")), str(item.get("message_id"))) for item in entries}
+
+    for target_post in unique_posts:
+        target_channel_id = int(target_post["channel_id"])
+        preferred_integration = str(target_post.get("preferred_integration") or "").strip()
+
+        if str(target_channel_id) in posted_channel_ids:
+            print(f"↷ Already has novel card for {SHORT_CODE} in {target_channel_id}; skipping.")
+            continue
+    
+        try:
+            channel = await resolve_channel(target_channel_id)
+            target_integration = integration_for_channel(channel, preferred_integration)
+            novel_role_mention = resolve_novel_role_mention(SHORT_CODE, target_integration)
+    
+            payload = build_message_payload_for_channel(
+                title=title,
+                novel=novel,
+                host=host,
+                status_text=status_text,
+                links_text=links_text,
+                target_channel_id=int(channel.id),
+                target_integration=target_integration,
+                novel_role_mention=novel_role_mention,
             )
 
-            # Get the forum/thread ID from this host's configured Discord target, if any.
-            forum_post_id = resolve_forum_post_id(host, SHORT_CODE)
-
-            if not forum_post_id:
-                print(f"Warning: no forum/thread ID found for {SHORT_CODE} in this host's configured Discord target.")
-
-            forum_post_url = await build_forum_post_url(forum_post_id)
-
-            # Always post to the primary/private archive.
-            # Also post to the host/server archive when integrations.json points
-            # this host to a Discord repo whose server.json has novel_cards_archive.
-            # If a second channel/thread ID is passed manually, treat it as an
-            # extra override/testing target. Each target resolves its role field
-            # from the Discord integration that owns that channel/server.
-            target_posts = [
-                {
-                    "channel_id": ARCHIVE_CHANNEL_ID,
-                    "preferred_integration": DISCORD_INTEGRATION,
-                }
-            ]
-
-            host_archive_target = host_novel_cards_archive_target(host)
-
-            if host_archive_target:
-                target_posts.append(host_archive_target)
-
-            if EXTRA_CHANNEL_ID:
-                target_posts.append({
-                    "channel_id": EXTRA_CHANNEL_ID,
-                    "preferred_integration": host_discord_integration_for_host(host),
-                })
-
-            # Avoid duplicate posts while preserving target integration hints.
-            unique_posts = []
-            seen_channel_ids = set()
-
-            for post in target_posts:
-                channel_id = int(post["channel_id"])
-                if channel_id in seen_channel_ids:
-                    continue
-                seen_channel_ids.add(channel_id)
-                unique_posts.append(post)
-
-            state.setdefault(SHORT_CODE, [])
-
-            for target_post in unique_posts:
-                target_channel_id = int(target_post["channel_id"])
-                preferred_integration = str(target_post.get("preferred_integration") or "").strip()
-
-                already_posted = any(
-                    str(item.get("channel_id")) == str(target_channel_id)
-                    for item in state.get(SHORT_CODE, [])
-                )
-            
-                if already_posted:
-                    print(f"↷ Already has novel card for {SHORT_CODE} in {target_channel_id}; skipping.")
-                    continue
-            
-                try:
-                    channel = await resolve_channel(target_channel_id)
-                    target_integration = integration_for_channel(channel, preferred_integration)
-                    novel_role_mention = resolve_novel_role_mention(SHORT_CODE, target_integration)
-            
-                    payload = build_message_payload_for_channel(
-                        title=title,
-                        novel=novel,
-                        host=host,
-                        completed=completed,
-                        next_free_dt=next_free_dt,
-                        last_free_dt=last_free_dt,
-                        target_channel_id=int(channel.id),
-                        target_integration=target_integration,
-                        forum_post_url=forum_post_url,
-                        novel_role_mention=novel_role_mention,
-                    )
-
-                    msg = await channel.send(**to_discord_py_kwargs(payload))
-
-                    entry = {
-                        "channel_id": str(channel.id),
-                        "message_id": str(msg.id),
-                    }
-
-                    if entry not in state[SHORT_CODE]:
-                        state[SHORT_CODE].append(entry)
-                        save_state(state)
-
-                    print(f"Posted novel card for {SHORT_CODE} to {channel.id} using {target_integration or 'no'} Discord integration")
-
-                except Exception as e:
-                    print(f"Failed to post novel card for {SHORT_CODE} to {target_channel_id}: {e}")
-
-            await bot.close()
-            return
-
-    print("Novel not found in mappings.")
+            msg = await channel.send(**to_discord_py_kwargs(payload))
+
+            entry = {
+                "channel_id": str(channel.id),
+                "message_id": str(msg.id),
+            }
+
+            key = (entry["channel_id"], entry["message_id"])
+            posted_channel_ids.add(entry["channel_id"])
+            if key not in posted_keys:
+                posted_keys.add(key)
+                entries.append(entry)
+                save_state(state)
+
+            print(f"Posted novel card for {SHORT_CODE} to {channel.id} using {target_integration or 'no'} Discord integration")
+
+        except Exception as e:
+            print(f"Failed to post novel card for {SHORT_CODE} to {target_channel_id}: {e}")
+
     await bot.close()
 
 
@@ -2,10 +2,8 @@
 import os
 import sys
 import json
-import re
-import requests
-from datetime import datetime, timezone
-from dateutil import parser as dateparser
+import asyncio
+import aiohttp
 
 import discord
 from discord import Embed
@@ -17,6 +15,7 @@ if str(ROOT) not in sys.path:
 
 from novel_mappings import HOSTING_SITE_DATA
 from host_utils import get_host_utils
+from novel_status_common import SHORT_CODE_INDEX, compute_status, fetch_api, flatten_chapters
 
 # ─── CONFIG ────────────────────────────────────────────────────────────────────
 TOKEN = os.environ["DISCORD_BOT_TOKEN"]
@@ -30,113 +29,25 @@ def load_targets():
     with open(TARGETS_FILE, encoding="utf-8") as f:
         return json.load(f)
 
-def resolve_short_code(title: str, host: str) -> str | None:
-    title = title.strip().lower()
-    host  = host.strip().lower()
+# (host, title) -> short_code
+_TITLE_INDEX = {}
+
+for _host, _data in HOSTING_SITE_DATA.items():
+    for _title, _novel in _data.get("novels", {}).items():
+        _TITLE_INDEX.setdefault((_host.lower(), _title.strip().lower()), _novel.get("short_code"))
 
-    for h, data in HOSTING_SITE_DATA.items():
-        if h.lower() != host:
-            continue
-        for novel_title, novel in data["novels"].items():
-            if novel_title.strip().lower() == title:
-                return novel.get("short_code")
-    return None
+def resolve_short_code(title: str, host: str) -> str | None:
+    return _TITLE_INDEX.get((host.strip().lower(), title.strip().lower()))
 
 
 def resolve_title_host_from_short_code(short_code: str) -> tuple[str, str] | None:
-    want = str(short_code or "").strip().upper()
+    entry = SHORT_CODE_INDEX.get(str(short_code or "").strip().upper())
 
-    if not want:
+    if not entry:
         return None
 
-    for host, data in HOSTING_SITE_DATA.items():
-        for novel_title, novel in data.get("novels", {}).items():
-            if str(novel.get("short_code") or "").strip().upper() == want:
-                return novel_title, host
-
-    return None
-
-def fetch_api(url, cookie_env):
-    headers = {}
-    cookie = os.environ.get(cookie_env)
-    if cookie:
-        headers["Cookie"] = cookie
-    r = requests.get(url, headers=headers, timeout=15)
-    r.raise_for_status()
-    return r.json()
-
-def flatten_chapters(api):
-    vols = api.get("data", []) if isinstance(api, dict) else api or []
-    out = []
-    for v in vols:
-        for c in v.get("chapters", []):
-            if not c.get("isHidden"):
-                out.append(c)
-    out.sort(key=lambda c: (c.get("order", 0), c.get("createdAt", "")))
-    return out
-
-def text_match(needle: str, haystack: str) -> bool:
-    if not needle or not haystack:
-        return False
-    return re.search(
-        rf"\b{re.escape(needle)}\b",
-        haystack,
-        flags=re.IGNORECASE
-    ) is not None
-
-def compute_status(chapters, last_chapter_text):
-    completed = False
-    next_free_dt = None
-    last_free_dt = None
-
-    last_chapter_text = (last_chapter_text or "").strip()
-
-    # ── Case 1: Chapter N
-    m = re.match(
-        r"chapter\s+(\d+(\.\d+)?)(?:\b|[^0-9])",
-        last_chapter_text,
-        re.IGNORECASE
-    )
-    if m:
-        target_num = m.group(1)
-        for c in chapters:
-            if str(c.get("chapterNumber", "")).strip() == target_num:
-                completed = True
-                break
-                
-    # ── Case 2: Extras / side stories / named chapters
-    else:
-        needle = last_chapter_text
-        if needle:
-            for c in chapters:
-                if (
-                    text_match(needle, c.get("chapterNumber") or "") or
-                    text_match(needle, c.get("title") or "")
-                ):
-                    completed = True
-                    break
-    
-    # ── Next free chapter logic
-    now = datetime.now(timezone.utc)
-
-    for c in chapters:
-        free_at = c.get("freeAt")
-        if not free_at:
-            continue
-
-        try:
-            dt = dateparser.parse(free_at)
-        except Exception:
-            continue
-
-        if dt > now:
-            if not next_free_dt or dt < next_free_dt:
-                next_free_dt = dt
-        else:
-            if not last_free_dt or dt > last_free_dt:
-                last_free_dt = dt
-
-    return completed, next_free_dt, last_free_dt
+    host, _, novel_title, _ = entry
+    return novel_title, host
 
 def build_status_value(completed, next_free_dt, last_free_dt):
     lines = []
@@ -160,22 +71,15 @@ def build_status_value(completed, next_free_dt, last_free_dt):
 
 def update_status_field(embed: Embed, new_value: str) -> Embed:
     found = False
-    new_fields = []
 
-    for f in embed.fields:
+    for i, f in enumerate(embed.fields):
         if "status" in f.name.lower():
-            new_fields.append((f.name, new_value, f.inline))
+            embed.set_field_at(i, name=f.name, value=new_value, inline=f.inline)
             found = True
-        else:
-            new_fields.append((f.name, f.value, f.inline))
 
     if not found:
         raise RuntimeError("No Status field found in embed")
 
-    embed.clear_fields()
-    for name, value, inline in new_fields:
-        embed.add_field(name=name, value=value, inline=inline)
-
     return embed
 
 # ─── Main ───────────────────────────────────────────────────────────────────────
@@ -218,63 +122,74 @@ bot = discord.Client(intents=intents)
 async def on_ready():
     print(f"🔄 Updating status for {short_code}")
 
-    for host_name, data in HOSTING_SITE_DATA.items():
-        if host_name.strip().lower() != HOST.strip().lower():
-            continue
-
-        for novel_title, novel in data["novels"].items():
-            if str(novel.get("short_code") or "").strip().upper() != short_code:
-                continue
-
-            utils = get_host_utils(host_name)
-            resolve_api_url = utils.get("resolve_chapters_api_url")
-
-            if not resolve_api_url:
-                print(f"❌ Host {host_name} does not support resolve_chapters_api_url.")
-                continue
-
-            api_url = resolve_api_url(data, novel_title, novel)
-
-            if not api_url:
-                print(f"❌ No chapters_api_url found for {host_name} / {novel_title}")
-                continue
-
-            api = fetch_api(api_url, data["token_secret"])
-            chapters = flatten_chapters(api)
-            
-            completed, next_free, last_free = compute_status(
-                chapters,
-                novel.get("last_chapter")
-            )
-            status_value = build_status_value(completed, next_free, last_free)
-
-            for t in targets:
-                ch = bot.get_channel(int(t["channel_id"])) or await bot.fetch_channel(int(t["channel_id"]))
-                if not ch:
-                    print("❌ Channel not found:", t["channel_id"])
-                    continue
-
-                # 🔧 FIX: revive archived thread if needed
-                if isinstance(ch, discord.Thread) and ch.archived:
-                    try:
-                        temp_msg = await ch.send("\u200b")  # invisible message
-                        await temp_msg.delete()
-                        print(f"🧵 Revived thread {ch.id}")
-                    except Exception as e:
-                        print(f"❌ Failed to revive thread {ch.id}: {e}")
-                        continue
-
-                msg = await ch.fetch_message(int(t["message_id"]))
-                if not msg.embeds:
-                    print("❌ No embed on message", msg.id)
-                    continue
-
-                embed = msg.embeds[0]
-                embed = update_status_field(embed, status_value)
-
-                await msg.edit(embed=embed)
-                print(f"✅ Updated {short_code} → {msg.id}")
+    entry = SHORT_CODE_INDEX.get(short_code)
+    if entry and entry[0].strip().lower() == HOST.strip().lower():
+        await update_cards(*entry)
 
     await bot.close()
 
+async def update_cards(host_name, data, novel_title, novel):
+    utils = get_host_utils(host_name)
+    resolve_api_url = utils.get("resolve_chapters_api_url")
+
+    if not resolve_api_url:
+        print(f"❌ Host {host_name} does not support resolve_chapters_api_url.")
+        return
+
+    api_url = resolve_api_url(data, novel_title, novel)
+
+    if not api_url:
+        print(f"❌ No chapters_api_url found for {host_name} / {novel_title}")
+        return
+
+    async with aiohttp.ClientSession() as session:
+        api = await fetch_api(session, api_url, data["token_secret"])
+    chapters = flatten_chapters(api)
+
+    completed, next_free, last_free = compute_status(
+        chapters,
+        novel.get("last_chapter")
+    )
+    status_value = build_status_value(completed, next_free, last_free)
+
+    results = await asyncio.gather(
+        *(update_one_card(t, status_value) for t in targets),
+        return_exceptions=True,
+    )
+    for t, result in zip(targets, results):
+        if isinstance(result, Exception):
+            print(f"❌ Failed to update {short_code} → {t['message_id']}: {result}")
+
+async def update_one_card(t, status_value):
+    ch = bot.get_channel(int(t["channel_id"])) or await bot.fetch_channel(int(t["channel_id"]))
+    if not ch:
+        print("❌ Channel not found:", t["channel_id"])
+        return
+
+    msg = await ch.fetch_message(int(t["message_id"]))
+    if not msg.embeds:
+        print("❌ No embed on message", msg.id)
+        return
+
+    embed = msg.embeds[0]
+    current = next((f.value for f in embed.fields if "status" in f.name.lower()), None)
+    if current == status_value:
+        print(f"↷ No status change for {short_code} → {msg.id}")
+        return
+
+    # 🔧 FIX: revive archived thread only when an edit will happen
+    if isinstance(ch, discord.Thread) and ch.archived:
+        try:
+            temp_msg = await ch.send("\u200b")  # invisible message
+            await temp_msg.delete()
+            print(f"🧵 Revived thread {ch.id}")
+        except Exception as e:
+            print(f"❌ Failed to revive thread {ch.id}: {e}")
+            return
+
+    embed = update_status_field(embed, status_value)
+
+    await msg.edit(embed=embed)
+    print(f"✅ Updated {short_code} → {msg.id}")
+
 bot.run(TOKEN)